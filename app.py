@@ -2,6 +2,7 @@
 Entry point for the Databricks Genie Slack Bot.
 """
 
+import asyncio
 import logging
 import sys
 
@@ -10,46 +11,59 @@ from genie_client import GenieClient
 from slack_bot import SlackGenieBot
 
 
-def main():
+async def main():
+    config = Config.load()
     logging.basicConfig(
-        level=getattr(logging, Config.LOG_LEVEL, logging.INFO),
+        level=getattr(logging, config.LOG_LEVEL, logging.INFO),
         format="%(asctime)s  %(name)-28s  %(levelname)-8s  %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)],
     )
+    # Skip per-record caller-frame lookup and thread/process info; none of
+    # it appears in our log format.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
     logger = logging.getLogger(__name__)
 
+    genie = None
     try:
-        Config.validate()
+        config.validate()
         logger.info("Configuration OK")
 
         genie = GenieClient(
-            host=Config.DATABRICKS_HOST,
-            token=Config.DATABRICKS_TOKEN,
-            space_id=Config.DATABRICKS_GENIE_SPACE_ID,
-            poll_interval=Config.GENIE_POLL_INTERVAL,
-            max_wait=Config.GENIE_MAX_WAIT,
+            host=config.DATABRICKS_HOST,
+            token=config.DATABRICKS_TOKEN,
+            space_id=config.DATABRICKS_GENIE_SPACE_ID,
+            poll_interval=config.GENIE_POLL_INTERVAL,
+            poll_initial=config.GENIE_POLL_INITIAL,
+            max_wait=config.GENIE_MAX_WAIT,
         )
         logger.info("Genie client ready  (%s, space %s)",
-                     Config.DATABRICKS_HOST, Config.DATABRICKS_GENIE_SPACE_ID)
+                     config.DATABRICKS_HOST, config.DATABRICKS_GENIE_SPACE_ID)
 
         bot = SlackGenieBot(
-            slack_bot_token=Config.SLACK_BOT_TOKEN,
-            slack_signing_secret=Config.SLACK_SIGNING_SECRET,
-            slack_app_token=Config.SLACK_APP_TOKEN,
+            slack_bot_token=config.SLACK_BOT_TOKEN,
+            slack_signing_secret=config.SLACK_SIGNING_SECRET,
+            slack_app_token=config.SLACK_APP_TOKEN,
             genie=genie,
         )
         logger.info("Starting Slack socket-mode handler ...")
-        bot.start()
+        await bot.start()
 
     except ValueError as exc:
         logger.error("Config error: %s", exc)
         sys.exit(1)
-    except KeyboardInterrupt:
-        logger.info("Shutting down ...")
     except Exception as exc:
         logger.error("Fatal: %s", exc, exc_info=True)
         sys.exit(1)
+    finally:
+        if genie is not None:
+            await genie.close()
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logging.getLogger(__name__).info("Shutting down ...")
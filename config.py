@@ -1,42 +1,69 @@
 """
 Configuration management for the Databricks Genie Slack App.
 Reads from environment variables (set via .env locally or app.yaml in Databricks Apps).
+
+Nothing is read at import time; call ``Config.load()`` to get the (cached) settings.
 """
 
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 
+@dataclass(frozen=True)
 class Config:
     # Slack
-    SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
-    SLACK_SIGNING_SECRET = os.getenv("SLACK_SIGNING_SECRET")
-    SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN")
+    SLACK_BOT_TOKEN: Optional[str]
+    SLACK_SIGNING_SECRET: Optional[str]
+    SLACK_APP_TOKEN: Optional[str]
 
     # Databricks
-    DATABRICKS_HOST = os.getenv("DATABRICKS_HOST")
-    DATABRICKS_TOKEN = os.getenv("DATABRICKS_TOKEN")
-    DATABRICKS_GENIE_SPACE_ID = os.getenv("DATABRICKS_GENIE_SPACE_ID")
+    DATABRICKS_HOST: Optional[str]
+    DATABRICKS_TOKEN: Optional[str]
+    DATABRICKS_GENIE_SPACE_ID: Optional[str]
 
     # App
-    PORT = int(os.getenv("PORT", "3000"))
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    PORT: int
+    LOG_LEVEL: str
 
     # Genie polling
-    GENIE_POLL_INTERVAL = int(os.getenv("GENIE_POLL_INTERVAL", "2"))
-    GENIE_MAX_WAIT = int(os.getenv("GENIE_MAX_WAIT", "90"))
+    GENIE_POLL_INTERVAL: float
+    GENIE_POLL_INITIAL: float
+    GENIE_MAX_WAIT: int
 
     @classmethod
-    def validate(cls):
+    @lru_cache(maxsize=None)
+    def load(cls) -> "Config":
+        # Look next to this file, not in the cwd, so the app can be started
+        # from any directory.
+        dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+        if os.path.exists(dotenv_path):
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path)
+
+        return cls(
+            SLACK_BOT_TOKEN=os.getenv("SLACK_BOT_TOKEN"),
+            SLACK_SIGNING_SECRET=os.getenv("SLACK_SIGNING_SECRET"),
+            SLACK_APP_TOKEN=os.getenv("SLACK_APP_TOKEN"),
+            DATABRICKS_HOST=os.getenv("DATABRICKS_HOST"),
+            DATABRICKS_TOKEN=os.getenv("DATABRICKS_TOKEN"),
+            DATABRICKS_GENIE_SPACE_ID=os.getenv("DATABRICKS_GENIE_SPACE_ID"),
+            PORT=int(os.getenv("PORT", "3000")),
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+            GENIE_POLL_INTERVAL=float(os.getenv("GENIE_POLL_INTERVAL", "2")),
+            GENIE_POLL_INITIAL=float(os.getenv("GENIE_POLL_INITIAL", "0.3")),
+            GENIE_MAX_WAIT=int(os.getenv("GENIE_MAX_WAIT", "90")),
+        )
+
+    def validate(self):
         required = {
-            "SLACK_BOT_TOKEN": cls.SLACK_BOT_TOKEN,
-            "SLACK_SIGNING_SECRET": cls.SLACK_SIGNING_SECRET,
-            "SLACK_APP_TOKEN": cls.SLACK_APP_TOKEN,
-            "DATABRICKS_HOST": cls.DATABRICKS_HOST,
-            "DATABRICKS_TOKEN": cls.DATABRICKS_TOKEN,
-            "DATABRICKS_GENIE_SPACE_ID": cls.DATABRICKS_GENIE_SPACE_ID,
+            "SLACK_BOT_TOKEN": self.SLACK_BOT_TOKEN,
+            "SLACK_SIGNING_SECRET": self.SLACK_SIGNING_SECRET,
+            "SLACK_APP_TOKEN": self.SLACK_APP_TOKEN,
+            "DATABRICKS_HOST": self.DATABRICKS_HOST,
+            "DATABRICKS_TOKEN": self.DATABRICKS_TOKEN,
+            "DATABRICKS_GENIE_SPACE_ID": self.DATABRICKS_GENIE_SPACE_ID,
         }
         missing = [k for k, v in required.items() if not v]
         if missing:
@@ -7,64 +7,147 @@ logic (polling, response parsing, result formatting) without touching the Slack
 API reference: https://docs.databricks.com/api/workspace/genie
 """
 
+import asyncio
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, List, Tuple
 
-import requests
+import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Transient Genie responses worth retrying, and the backoff between attempts
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 0.25
+# Upper bound on how long a server-sent Retry-After may make us wait
+_MAX_RETRY_AFTER = 60
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Seconds to wait before retry ``attempt``: the server's ``Retry-After``
+    (seconds or HTTP date, capped at ``_MAX_RETRY_AFTER``) when present,
+    but never less than the exponential backoff.
+    """
+    backoff = _BACKOFF_FACTOR * 2 ** attempt
+    if not retry_after:
+        return backoff
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return backoff
+    return min(max(seconds, backoff), _MAX_RETRY_AFTER)
+
 
 class GenieClient:
     """
     Thin wrapper around the Databricks Genie Conversation REST API.
 
-    All HTTP calls go through ``requests`` with a PAT token so the logic
-    is fully transparent and easy to customise.
+    All HTTP calls go through a shared ``aiohttp`` session with a PAT token,
+    so many in-flight questions can poll Genie from a single event loop.
     """
 
     def __init__(self, host: str, token: str, space_id: str,
-                 poll_interval: int = 2, max_wait: int = 90):
+                 poll_interval: float = 2, max_wait: int = 90,
+                 poll_initial: float = 0.3):
         self.host = host.rstrip("/")
         self.space_id = space_id
         self.poll_interval = poll_interval
+        self.poll_initial = poll_initial
         self.max_wait = max_wait
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Every endpoint lives under this prefix; built once instead of per call
+        self._spaces_path = f"/api/2.0/genie/spaces/{space_id}"
+        self._headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
-        })
+        }
+        self._timeout = aiohttp.ClientTimeout(sock_connect=3.05, sock_read=30)
+        # Created lazily so it binds to the event loop that actually runs the bot
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (conversation_id, message_id)  →  (ETag, last body) for conditional polls
+        self._etags: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # Low-level helpers
     # ------------------------------------------------------------------
 
-    def _url(self, path: str) -> str:
-        return f"{self.host}{path}"
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=self._timeout,
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _request(self, method: str, path: str,
+                       etag_key: Optional[Tuple[str, str]] = None,
+                       **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Execute an authenticated request and return the JSON body.
 
-    def _request(self, method: str, path: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """Execute an authenticated request and return the JSON body."""
-        url = self._url(path)
-        try:
-            resp = self.session.request(method, url, **kwargs)
-            resp.raise_for_status()
-            if resp.content:
-                return resp.json()
-            return {}
-        except requests.HTTPError as exc:
-            logger.error("HTTP %s %s → %s: %s", method, path, exc.response.status_code,
-                         exc.response.text[:500])
-            return None
-        except Exception as exc:
-            logger.error("Request failed %s %s: %s", method, path, exc)
-            return None
+        Transient statuses and connection errors are retried with exponential
+        backoff (``_BACKOFF_FACTOR * 2**attempt``) up to ``_MAX_RETRIES`` times;
+        a ``Retry-After`` header on the response is honoured when present.
+
+        When ``etag_key`` is given, the previous response's ``ETag`` is sent as
+        ``If-None-Match`` and a ``304 Not Modified`` returns the cached body.
+        Servers that ignore the header simply return the full body as usual.
+        """
+        url = self.host + path
+        cached = self._etags.get(etag_key) if etag_key else None
+        if cached:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+        for attempt in range(_MAX_RETRIES + 1):
+            retrying = attempt < _MAX_RETRIES
+            try:
+                async with self.session.request(method, url, **kwargs) as resp:
+                    body = await resp.read()
+                    if resp.status == 304 and cached:
+                        return cached[1]
+                    if resp.status in _RETRY_STATUSES and retrying:
+                        await asyncio.sleep(
+                            _retry_delay(resp.headers.get("Retry-After"), attempt))
+                        continue
+                    if resp.status >= 400:
+                        logger.error("HTTP %s %s → %s: %s", method, path, resp.status,
+                                     body[:500].decode("utf-8", "replace"))
+                        return None
+                    data = orjson.loads(body) if body else {}
+                    etag = resp.headers.get("ETag")
+                    if etag_key and etag:
+                        self._etags[etag_key] = (etag, data)
+                    return data
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if retrying:
+                    await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+                    continue
+                logger.error("Request failed %s %s: %s", method, path, exc)
+                return None
+            except Exception as exc:
+                logger.error("Request failed %s %s: %s", method, path, exc)
+                return None
+        return None
 
     # ------------------------------------------------------------------
     # Conversation lifecycle
     # ------------------------------------------------------------------
 
-    def start_conversation(self, question: str) -> Optional[Dict[str, Any]]:
+    async def start_conversation(self, question: str) -> Optional[Dict[str, Any]]:
         """
         Start a brand-new conversation with an initial question.
 
@@ -73,81 +156,92 @@ class GenieClient:
 
         Returns the raw API response containing ``conversation`` and ``message`` keys.
         """
-        path = f"/api/2.0/genie/spaces/{self.space_id}/start-conversation"
-        return self._request("POST", path, json={"content": question})
+        path = self._spaces_path + "/start-conversation"
+        return await self._request("POST", path, data=orjson.dumps({"content": question}))
 
-    def create_message(self, conversation_id: str, question: str) -> Optional[Dict[str, Any]]:
+    async def create_message(self, conversation_id: str, question: str) -> Optional[Dict[str, Any]]:
         """
         Send a follow-up message inside an existing conversation.
 
         POST /api/2.0/genie/spaces/{space_id}/conversations/{cid}/messages
         Body: {"content": "<question>"}
         """
-        path = (f"/api/2.0/genie/spaces/{self.space_id}"
-                f"/conversations/{conversation_id}/messages")
-        return self._request("POST", path, json={"content": question})
+        path = self._spaces_path + "/conversations/" + conversation_id + "/messages"
+        return await self._request("POST", path, data=orjson.dumps({"content": question}))
 
-    def get_message(self, conversation_id: str, message_id: str) -> Optional[Dict[str, Any]]:
+    async def get_message(self, conversation_id: str, message_id: str) -> Optional[Dict[str, Any]]:
         """
         Poll for the status / result of a message.
 
         GET /api/2.0/genie/spaces/{space_id}/conversations/{cid}/messages/{mid}
         """
-        path = (f"/api/2.0/genie/spaces/{self.space_id}"
-                f"/conversations/{conversation_id}/messages/{message_id}")
-        return self._request("GET", path)
+        path = (self._spaces_path + "/conversations/" + conversation_id
+                + "/messages/" + message_id)
+        return await self._request("GET", path,
+                                   etag_key=(conversation_id, message_id))
 
-    def get_query_result(self, conversation_id: str, message_id: str,
-                         attachment_id: str) -> Optional[Dict[str, Any]]:
+    async def get_query_result(self, conversation_id: str, message_id: str,
+                               attachment_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve the SQL query result rows for an attachment.
 
         GET /api/2.0/genie/spaces/{space_id}/conversations/{cid}/messages/{mid}
               /attachments/{aid}/query-result
         """
-        path = (f"/api/2.0/genie/spaces/{self.space_id}"
-                f"/conversations/{conversation_id}/messages/{message_id}"
-                f"/attachments/{attachment_id}/query-result")
-        return self._request("GET", path)
+        path = (self._spaces_path + "/conversations/" + conversation_id
+                + "/messages/" + message_id
+                + "/attachments/" + attachment_id + "/query-result")
+        return await self._request("GET", path)
 
-    def send_feedback(self, conversation_id: str, message_id: str,
-                      rating: str, feedback_text: Optional[str] = None) -> bool:
+    async def send_feedback(self, conversation_id: str, message_id: str,
+                            rating: str, feedback_text: Optional[str] = None) -> bool:
         """
         Submit thumbs-up / thumbs-down feedback on a Genie answer.
         ``rating`` should be ``"POSITIVE"`` or ``"NEGATIVE"``.
         """
-        path = (f"/api/2.0/genie/spaces/{self.space_id}"
-                f"/conversations/{conversation_id}/messages/{message_id}/feedback")
+        path = (self._spaces_path + "/conversations/" + conversation_id
+                + "/messages/" + message_id + "/feedback")
         payload: Dict[str, Any] = {"rating": rating.upper()}
         if feedback_text:
             payload["feedback_text"] = feedback_text
-        result = self._request("POST", path, json=payload)
+        result = await self._request("POST", path, data=orjson.dumps(payload))
         return result is not None
 
     # ------------------------------------------------------------------
     # High-level: ask and wait
     # ------------------------------------------------------------------
 
-    def _poll_until_done(self, conversation_id: str,
-                         message_id: str) -> Optional[Dict[str, Any]]:
-        """Poll ``get_message`` until status is COMPLETED / FAILED or timeout."""
+    async def _poll_until_done(self, conversation_id: str,
+                               message_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Poll ``get_message`` until status is COMPLETED / FAILED or timeout.
+
+        The delay between polls starts at ``poll_initial`` and grows by 1.5x
+        up to ``poll_interval``, so quick answers are picked up fast while
+        long-running queries don't hammer the API.
+        """
         deadline = time.time() + self.max_wait
-        while time.time() < deadline:
-            msg = self.get_message(conversation_id, message_id)
-            if msg is None:
-                return None
-            status = msg.get("status")
-            if status == "COMPLETED":
-                return msg
-            if status in ("FAILED", "CANCELLED"):
-                logger.warning("Message %s finished with status %s", message_id, status)
-                return msg
-            time.sleep(self.poll_interval)
-        logger.warning("Timed out waiting for message %s", message_id)
-        return None
+        delay = min(self.poll_initial, self.poll_interval)
+        try:
+            while time.time() < deadline:
+                msg = await self.get_message(conversation_id, message_id)
+                if msg is None:
+                    return None
+                status = msg.get("status")
+                if status == "COMPLETED":
+                    return msg
+                if status in ("FAILED", "CANCELLED"):
+                    logger.warning("Message %s finished with status %s", message_id, status)
+                    return msg
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.5, self.poll_interval)
+            logger.warning("Timed out waiting for message %s", message_id)
+            return None
+        finally:
+            self._etags.pop((conversation_id, message_id), None)
 
-    def _parse_response(self, conversation_id: str, message_id: str,
-                        msg: Dict[str, Any]) -> Dict[str, Any]:
+    async def _parse_response(self, conversation_id: str, message_id: str,
+                              msg: Dict[str, Any]) -> Dict[str, Any]:
         """
         Turn the raw completed-message payload into a friendlier dict.
 
@@ -178,6 +272,7 @@ class GenieClient:
         text_parts: List[str] = []
         sql_text: Optional[str] = None
         result_data: Optional[Dict[str, Any]] = None
+        query_attachment_ids: List[str] = []
 
         for att in attachments:
             if "text" in att:
@@ -192,9 +287,15 @@ class GenieClient:
                 sql_text = query_info.get("query")
                 attachment_id = att.get("attachment_id")
                 if attachment_id:
-                    qr = self.get_query_result(conversation_id, message_id, attachment_id)
-                    if qr:
-                        result_data = qr
+                    query_attachment_ids.append(attachment_id)
+
+        # Fetch all query results concurrently; the last non-empty one wins
+        query_results = await asyncio.gather(*(
+            self.get_query_result(conversation_id, message_id, aid)
+            for aid in query_attachment_ids))
+        for qr in query_results:
+            if qr:
+                result_data = qr
 
         response_text = "\n\n".join(text_parts) or msg.get("content", "")
 
@@ -209,10 +310,10 @@ class GenieClient:
             "error": None,
         }
 
-    def ask(self, question: str,
-            conversation_id: Optional[str] = None) -> Dict[str, Any]:
+    async def ask(self, question: str,
+                  conversation_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        High-level: send a question and block until the answer is ready.
+        High-level: send a question and wait until the answer is ready.
 
         Parameters
         ----------
@@ -228,9 +329,9 @@ class GenieClient:
               ``text``, ``sql``, ``result_data``, ``attachments``, ``error``.
         """
         if conversation_id:
-            raw = self.create_message(conversation_id, question)
+            raw = await self.create_message(conversation_id, question)
         else:
-            raw = self.start_conversation(question)
+            raw = await self.start_conversation(question)
 
         if raw is None:
             return {"success": False, "conversation_id": conversation_id,
@@ -247,9 +348,9 @@ class GenieClient:
             return {"success": False, "conversation_id": conversation_id,
                     "error": "Could not extract conversation/message IDs from response"}
 
-        completed = self._poll_until_done(cid, mid)
+        completed = await self._poll_until_done(cid, mid)
         if completed is None:
             return {"success": False, "conversation_id": cid, "message_id": mid,
                     "error": "Timed out waiting for Genie response"}
 
-        return self._parse_response(cid, mid, completed)
+        return await self._parse_response(cid, mid, completed)
@@ -3,32 +3,67 @@ Slack bot that forwards natural-language questions to Databricks Genie
 and posts the answers back in threads.
 """
 
+import asyncio
 import logging
 import re
-from typing import Dict, Any, Optional
+from itertools import islice
+from typing import Dict, Any, MutableMapping, Optional
 
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
-from slack_sdk import WebClient
+import aiohttp
+from cachetools import TTLCache
+from slack_bolt.app.async_app import AsyncApp
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+from slack_sdk.web.async_client import AsyncWebClient
 
 from genie_client import GenieClient
 
 logger = logging.getLogger(__name__)
 
+_MENTION_RE = re.compile(r"<@[A-Z0-9]+>")
+
+# Thread / feedback mappings are dropped after a week (or once 10k are held)
+_MAPPING_MAXSIZE = 10_000
+_MAPPING_TTL = 7 * 24 * 3600
+
 
 class SlackGenieBot:
 
+    # Identical on every answer, so built once and shared across posts
+    _FEEDBACK_BLOCKS = [
+        {"type": "section", "text": {
+            "type": "mrkdwn",
+            "text": "*Was this response helpful?*"}},
+        {"type": "actions", "elements": [
+            {"type": "button",
+             "text": {"type": "plain_text", "text": "Helpful", "emoji": True},
+             "action_id": "feedback_positive"},
+            {"type": "button",
+             "text": {"type": "plain_text", "text": "Not Helpful", "emoji": True},
+             "action_id": "feedback_negative"},
+        ]},
+    ]
+
     def __init__(self, slack_bot_token: str, slack_signing_secret: str,
                  slack_app_token: str, genie: GenieClient):
-        self.app = App(token=slack_bot_token, signing_secret=slack_signing_secret)
+        # One client for all outbound Slack calls, shared with Bolt. Its
+        # aiohttp session is attached in start() (it must be created inside the
+        # running loop); Bolt copies it into per-request clients, so every
+        # handler reuses the same keep-alive connections.
+        self.client = AsyncWebClient(token=slack_bot_token, timeout=10)
+        self.app = AsyncApp(client=self.client, signing_secret=slack_signing_secret)
         self.slack_app_token = slack_app_token
         self.genie = genie
-        self.client = WebClient(token=slack_bot_token)
+
+        # AsyncApp runs every listener as a coroutine on one event loop, so
+        # these mappings are never mutated concurrently and need no lock.
+        # Keep it that way: don't touch them from executor threads.
 
         # slack thread_ts  →  genie conversation_id
-        self.thread_conversations: Dict[str, str] = {}
+        self.thread_conversations: MutableMapping[str, str] = TTLCache(
+            maxsize=_MAPPING_MAXSIZE, ttl=_MAPPING_TTL)
         # slack message ts  →  (conversation_id, message_id) for feedback
-        self.feedback_map: Dict[str, tuple] = {}
+        self.feedback_map: MutableMapping[str, tuple] = TTLCache(
+            maxsize=_MAPPING_MAXSIZE, ttl=_MAPPING_TTL)
 
         self._register_handlers()
 
@@ -39,29 +74,29 @@ class SlackGenieBot:
     def _register_handlers(self):
 
         @self.app.event("app_mention")
-        def on_mention(event, say, client):
-            self._handle_question(event, say, client)
+        async def on_mention(event, say, client):
+            await self._handle_question(event, say, client)
 
         @self.app.event("message")
-        def on_message(event, say, client):
+        async def on_message(event, say, client):
             if event.get("channel_type") == "im" or event.get("thread_ts"):
-                self._handle_question(event, say, client)
+                await self._handle_question(event, say, client)
 
         @self.app.action("feedback_positive")
-        def on_positive(ack, body, client):
-            ack()
-            self._handle_feedback(body, "POSITIVE", client)
+        async def on_positive(ack, body, client):
+            await ack()
+            await self._handle_feedback(body, "POSITIVE", client)
 
         @self.app.action("feedback_negative")
-        def on_negative(ack, body, client):
-            ack()
-            self._handle_feedback(body, "NEGATIVE", client)
+        async def on_negative(ack, body, client):
+            await ack()
+            await self._handle_feedback(body, "NEGATIVE", client)
 
     # ------------------------------------------------------------------
     # Core question → Genie → Slack flow
     # ------------------------------------------------------------------
 
-    def _handle_question(self, event: Dict[str, Any], say, client):
+    async def _handle_question(self, event: Dict[str, Any], say, client):
         if event.get("bot_id"):
             return
 
@@ -70,32 +105,49 @@ class SlackGenieBot:
         thread_ts = event.get("thread_ts") or event["ts"]
 
         if not text.strip():
-            say("Please ask me a question about your data!", thread_ts=thread_ts)
+            await say("Please ask me a question about your data!", thread_ts=thread_ts)
             return
 
-        client.chat_postMessage(channel=channel, text="Thinking...",
-                                thread_ts=thread_ts)
+        placeholder = await client.chat_postMessage(channel=channel, text="Thinking...",
+                                                    thread_ts=thread_ts)
 
         conversation_id = self.thread_conversations.get(thread_ts)
 
-        result = self.genie.ask(text, conversation_id=conversation_id)
+        result = await self.genie.ask(text, conversation_id=conversation_id)
 
         if result.get("conversation_id"):
             self.thread_conversations[thread_ts] = result["conversation_id"]
 
-        # Main answer text
+        # The answer edits the existing placeholder, so it can go out alongside
+        # the table / feedback posts; those two stay sequential to keep their
+        # order in the thread. If the edit fails, the answer is re-posted as a
+        # new message and may then land after the table / buttons.
+        await asyncio.gather(
+            self._post_answer(result, channel, thread_ts, placeholder["ts"], say, client),
+            self._post_result_and_feedback(result, channel, thread_ts, say, client),
+        )
+
+    async def _post_answer(self, result: Dict[str, Any], channel: str, thread_ts: str,
+                           placeholder_ts: str, say, client):
+        """Replace the "Thinking..." placeholder with the answer text."""
         answer = self._format_answer(result)
-        say(answer, thread_ts=thread_ts)
+        try:
+            await client.chat_update(channel=channel, ts=placeholder_ts, text=answer)
+        except Exception as exc:
+            logger.error("Failed to update placeholder message: %s", exc)
+            await say(answer, thread_ts=thread_ts)
 
+    async def _post_result_and_feedback(self, result: Dict[str, Any], channel: str,
+                                        thread_ts: str, say, client):
         # Query result table
         if result.get("result_data"):
             table_msg = self._format_query_result(result["result_data"])
             if table_msg:
-                say(table_msg, thread_ts=thread_ts)
+                await say(table_msg, thread_ts=thread_ts)
 
         # Feedback buttons
         if result.get("success") and result.get("conversation_id") and result.get("message_id"):
-            fb_resp = self._send_feedback_buttons(channel, thread_ts, client)
+            fb_resp = await self._send_feedback_buttons(channel, thread_ts, client)
             if fb_resp:
                 self.feedback_map[fb_resp["ts"]] = (
                     result["conversation_id"], result["message_id"])
@@ -106,7 +158,7 @@ class SlackGenieBot:
 
     @staticmethod
     def _strip_mention(text: str) -> str:
-        return re.sub(r"<@[A-Z0-9]+>", "", text).strip()
+        return _MENTION_RE.sub("", text).strip()
 
     @staticmethod
     def _format_answer(result: Dict[str, Any]) -> str:
@@ -126,62 +178,49 @@ class SlackGenieBot:
 
         col_names = [c.get("name", f"col_{i}") for i, c in enumerate(columns_meta)]
 
+        # Stringify each cell once; values wider than 30 chars are truncated.
+        display_rows = [[("" if v is None else str(v))[:30] for v in row]
+                        for row in islice(rows, max_rows)]
         widths = [len(n) for n in col_names]
-        display_rows = rows[:max_rows]
         for row in display_rows:
-            for i, val in enumerate(row):
-                widths[i] = max(widths[i], len(str(val) if val is not None else ""))
+            # zip tolerates rows shorter (or longer) than the schema
+            for i, (w, cell) in enumerate(zip(widths, row)):
+                if len(cell) > w:
+                    widths[i] = len(cell)
         widths = [min(w, 30) for w in widths]
 
         def fmt_row(values):
-            parts = []
-            for v, w in zip(values, widths):
-                s = str(v) if v is not None else ""
-                parts.append(s[:w].ljust(w))
-            return " | ".join(parts)
-
-        lines = [fmt_row(col_names),
-                 "-+-".join("-" * w for w in widths)]
-        for row in display_rows:
-            lines.append(fmt_row(row))
+            return " | ".join(s[:w].ljust(w) for s, w in zip(values, widths))
 
-        total = data_section.get("row_count", len(rows))
+        lines = "\n".join((fmt_row(col_names),
+                           "-+-".join("-" * w for w in widths),
+                           *(fmt_row(row) for row in display_rows)))
+
+        total = data_section.get("row_count") or len(rows)
         footer = ""
         if total > max_rows:
             footer = f"\n_Showing {max_rows} of {total} rows_"
 
-        return f"*Query Results:*\n```\n" + "\n".join(lines) + "\n```" + footer
+        return "*Query Results:*\n```\n" + lines + "\n```" + footer
 
     # ------------------------------------------------------------------
     # Feedback buttons
     # ------------------------------------------------------------------
 
-    def _send_feedback_buttons(self, channel: str, thread_ts: str,
-                               client) -> Optional[Dict]:
+    async def _send_feedback_buttons(self, channel: str, thread_ts: str,
+                                     client) -> Optional[Dict]:
         try:
-            return client.chat_postMessage(
+            return await client.chat_postMessage(
                 channel=channel,
                 thread_ts=thread_ts,
                 text="Was this response helpful?",
-                blocks=[
-                    {"type": "section", "text": {
-                        "type": "mrkdwn",
-                        "text": "*Was this response helpful?*"}},
-                    {"type": "actions", "elements": [
-                        {"type": "button",
-                         "text": {"type": "plain_text", "text": "Helpful", "emoji": True},
-                         "action_id": "feedback_positive"},
-                        {"type": "button",
-                         "text": {"type": "plain_text", "text": "Not Helpful", "emoji": True},
-                         "action_id": "feedback_negative"},
-                    ]},
-                ],
+                blocks=self._FEEDBACK_BLOCKS,
             )
         except Exception as exc:
             logger.error("Failed to send feedback buttons: %s", exc)
             return None
 
-    def _handle_feedback(self, body: Dict[str, Any], rating: str, client):
+    async def _handle_feedback(self, body: Dict[str, Any], rating: str, client):
         msg_ts = body.get("message", {}).get("ts")
         channel = body.get("channel", {}).get("id")
         info = self.feedback_map.get(msg_ts)
@@ -191,11 +230,11 @@ class SlackGenieBot:
             return
 
         conversation_id, message_id = info
-        success = self.genie.send_feedback(conversation_id, message_id, rating)
+        success = await self.genie.send_feedback(conversation_id, message_id, rating)
 
         label = "Thanks for your feedback!" if success else "Failed to submit feedback."
         try:
-            client.chat_update(
+            await client.chat_update(
                 channel=channel, ts=msg_ts, text=label,
                 blocks=[{"type": "section", "text": {"type": "mrkdwn", "text": f"_{label}_"}}],
             )
@@ -206,7 +245,12 @@ class SlackGenieBot:
     # Entry point
     # ------------------------------------------------------------------
 
-    def start(self):
-        handler = SocketModeHandler(self.app, self.slack_app_token)
-        logger.info("Starting Slack bot in socket mode ...")
-        handler.start()
+    async def start(self):
+        self.client.session = aiohttp.ClientSession()
+        try:
+            handler = AsyncSocketModeHandler(self.app, self.slack_app_token)
+            logger.info("Starting Slack bot in socket mode ...")
+            await handler.start_async()
+        finally:
+            await self.client.session.close()
+            self.client.session = None